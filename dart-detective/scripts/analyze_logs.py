@@ -3,248 +3,512 @@
 Flutter Log Analysis Script
 Parses Flutter/Android logs and identifies error patterns, stack traces, and anomalies.
 Usage: python3 analyze_logs.py [log_file] [--export json|txt]
+Optional: pip install hyperscan (or pyahocorasick) for faster scanning of large logs.
 """
 
+import os
+import stat
 import sys
 import re
+import functools
+import multiprocessing
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, deque
 from datetime import datetime
 
+try:
+    import hyperscan
+except ImportError:  # optional: fall back to the re-based checks
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:  # optional: fall back to one substring test per literal
+    ahocorasick = None
+
+# Patterns are compiled once at import. They are lowercase and run against the
+# lowercased line, which is cheaper than re.IGNORECASE. Each pattern also carries the
+# literals it cannot match without (any one of them): a line is only tried against
+# patterns whose literals it contains, and _match_rules has the rest of the flow.
+_ERROR_PATTERNS = tuple(
+    (literals, re.compile(pattern), name)
+    for pattern, literals, name in [
+        (r'(nullpointerexception|null pointer)', ('nullpointerexception', 'null pointer'), 'Null Pointer Exception'),
+        (r'(nosuchmethoderror)', ('nosuchmethoderror',), 'No Such Method Error'),
+        (r'(classcastexception)', ('classcastexception',), 'Type Cast Error'),
+        (r'(outofmemoryerror)', ('outofmemoryerror',), 'Out of Memory'),
+        (r'(stackoverflowerror)', ('stackoverflowerror',), 'Stack Overflow'),
+        (r'(ioexception|file not found)', ('ioexception', 'file not found'), 'File I/O Error'),
+        (r'(networkerror|connection refused)', ('networkerror', 'connection refused'), 'Network Error'),
+        (r'(timeoutexception)', ('timeoutexception',), 'Timeout Error'),
+        (r'(formatexception|json parsing)', ('formatexception', 'json parsing'), 'Format/JSON Parse Error'),
+        (r'(stateerror|invalid state)', ('stateerror', 'invalid state'), 'State Error'),
+    ]
+)
+
+_NULL_PATTERNS = tuple(
+    (literals, re.compile(pattern))
+    for pattern, literals in [
+        (r'null safety', ('null safety',)),
+        (r'nullable type', ('nullable type',)),
+        (r'null propagation', ('null propagation',)),
+        (r'unhandled exception.*null', ('unhandled exception',)),
+        (r'accessing.*null', ('accessing',)),
+    ]
+)
+
+_ASYNC_PATTERNS = tuple(
+    (literals, re.compile(pattern))
+    for pattern, literals in [
+        (r'(uncaught|unhandled).*(future|async|await)', ('uncaught', 'unhandled')),
+        (r'future.*failed', ('failed',)),
+        (r'(bad state|invalid async)', ('bad state', 'invalid async')),
+        (r'stream.*closed', ('closed',)),
+        (r'subscript.*cancelled', ('cancelled',)),
+        (r'(missingpluginexception)', ('missingpluginexception',)),
+    ]
+)
+
+_SECURITY_PATTERNS = tuple(
+    (literals, re.compile(pattern), issue_type)
+    for pattern, literals, issue_type in [
+        (r'(password|secret|token|api.*key).*(stored|saved|hardcoded)', ('stored', 'saved', 'hardcoded'), 'Credential Storage'),
+        (r'(ssl|certificate|tls).*verification.*(disabled|false)', ('verification',), 'SSL Verification Disabled'),
+        (r'(sql.*injection|command.*injection)', ('injection',), 'Injection Vulnerability'),
+        (r'(xss|cross.*site.*scripting)', ('xss', 'scripting'), 'XSS Vulnerability'),
+        (r'debug.*(enabled|true).*production', ('production',), 'Debug Enabled in Production'),
+        (r'log.*password|password.*log', ('password',), 'Password in Logs'),
+    ]
+)
+
+_PERF_PATTERNS = tuple(
+    (literals, re.compile(pattern), issue_type)
+    for pattern, literals, issue_type in [
+        (r'anr.*application not responding', ('application not responding',), 'ANR (App Not Responding)'),
+        (r'(jank|frame.*drop|dropped.*frame)', ('jank', 'frame'), 'Dropped Frames'),
+        (r'(memory.*pressure|low.*memory)', ('memory',), 'Memory Pressure'),
+        (r'(outofmemory|heap.*size)', ('outofmemory', 'heap'), 'Memory Issues'),
+        (r'(garbage.*collect|gc)', ('garbage', 'gc'), 'Garbage Collection'),
+        (r'(disk.*full|storage.*full)', ('full',), 'Disk Full'),
+    ]
+)
+
+# Checks run per line, in order:
+# (result bucket, ((literals, pattern, hit type, counter key), ...))
+_PATTERN_GROUPS = (
+    ('error', tuple((lits, rx, name, name) for lits, rx, name in _ERROR_PATTERNS)),
+    ('warning', tuple((lits, rx, 'Null Safety Issue', 'Null Safety Issue') for lits, rx in _NULL_PATTERNS)),
+    ('error', tuple((lits, rx, 'Async/Future Error', 'Async Error') for lits, rx in _ASYNC_PATTERNS)),
+    ('security', tuple((lits, rx, t, f'Security: {t}') for lits, rx, t in _SECURITY_PATTERNS)),
+    ('performance', tuple((lits, rx, t, f'Performance: {t}') for lits, rx, t in _PERF_PATTERNS)),
+)
+
+# Every rule in table order, as (literals, pattern, result bucket, hit type, counter key).
+# A rule's index is its bit in the literal prefilter mask and its hyperscan id.
+_RULES = tuple(
+    (literals, rx, bucket, hit_type, key)
+    for bucket, checks in _PATTERN_GROUPS for literals, rx, hit_type, key in checks
+)
+
+
+def _literal_bits():
+    """Map each prefilter literal to the mask of rules it gates"""
+    bits = {}
+    for index, (literals, *_) in enumerate(_RULES):
+        for literal in literals:
+            bits[literal] = bits.get(literal, 0) | 1 << index
+    return tuple(bits.items())
+
+
+_LITERAL_BITS = _literal_bits()
+
+
+def _regex_bits():
+    """Mask of rules that need a regex to confirm a literal hit.
+
+    A pattern that is only an alternation of its literals, like
+    (IOException|File not found), matches exactly when a literal does.
+    """
+    bits = 0
+    for index, (literals, rx, *_) in enumerate(_RULES):
+        alternatives = rx.pattern.strip('()').split('|')
+        if (any(c in alt for alt in alternatives for c in '.^$*+?{}[]\\|()')
+                or sorted(alternatives) != sorted(literals)):
+            bits |= 1 << index
+    return bits
+
+
+_REGEX_BITS = _regex_bits()
+
+
+def _group_bits():
+    """For each rule, the mask of every rule in its check group"""
+    masks = []
+    for _, checks in _PATTERN_GROUPS:
+        group = ((1 << len(checks)) - 1) << len(masks)
+        masks.extend([group] * len(checks))
+    return tuple(masks)
+
+
+_GROUP_BITS = _group_bits()
+
+# With pyahocorasick installed, one automaton pass over the line finds every literal
+if ahocorasick is not None:
+    _LITERAL_AUTOMATON = ahocorasick.Automaton()
+    for _literal, _bits in _LITERAL_BITS:
+        _LITERAL_AUTOMATON.add_word(_literal, _bits)
+    _LITERAL_AUTOMATON.make_automaton()
+else:
+    _LITERAL_AUTOMATON = None
+
+# With hyperscan installed, all patterns are compiled into one database and each
+# line is scanned once for every pattern.
+if hyperscan is not None:
+    _HS_DB = hyperscan.Database()
+    _HS_DB.compile(
+        expressions=[rx.pattern.encode() for _, rx, *_ in _RULES],
+        ids=list(range(len(_RULES))),
+        elements=len(_RULES),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(_RULES),
+    )
+else:
+    _HS_DB = None
+
+
+def _hs_on_match(rule_id, start, end, flags, matched):
+    matched.append(rule_id)
+
+
+# Leading timestamp/PID noise: everything before the first letter. No pattern can
+# match inside it, so lines that differ only there classify the same.
+_LINE_PREFIX = re.compile(r'^[\W\d_]+')
+
+# Longer lines (dumped payloads, minified JSON) are rarely repeated and would
+# pin their whole text in the cache, so they are classified uncached
+_MAX_CACHED_LINE = 512
+
+
+def _match_rules(text):
+    """Return the _RULES entries matching a log line, in table order.
+
+    Only the first matching rule of each check group counts, so a line is
+    reported at most once per group. Callers pass the line without _LINE_PREFIX.
+    """
+    if _HS_DB is not None:
+        matched = []
+        _HS_DB.scan(text.encode('utf-8', 'ignore'), match_event_handler=_hs_on_match, context=matched)
+        mask = 0
+        for rule_id in matched:
+            mask |= 1 << rule_id
+        hits = []
+        while mask:
+            index = (mask & -mask).bit_length() - 1
+            hits.append(_RULES[index])
+            mask &= ~_GROUP_BITS[index]
+        return tuple(hits)
+
+    lowered = text.lower()
+    mask = 0
+    if _LITERAL_AUTOMATON is not None:
+        for _, bits in _LITERAL_AUTOMATON.iter(lowered):
+            mask |= bits
+    else:
+        for literal, bits in _LITERAL_BITS:
+            if literal in lowered:
+                mask |= bits
+
+    # Only rules whose literal showed up can match, lowest bit first; the first
+    # match of a group skips the rest of that group
+    hits = []
+    while mask:
+        bit = mask & -mask
+        index = bit.bit_length() - 1
+        if not bit & _REGEX_BITS or _RULES[index][1].search(lowered):
+            hits.append(_RULES[index])
+            mask &= ~_GROUP_BITS[index]
+        else:
+            mask ^= bit
+    return tuple(hits)
+
+
+# Production logs repeat the same short lines (retry loops, frame drops)
+# thousands of times; only lines up to _MAX_CACHED_LINE go through here
+_match_rules_cached = functools.lru_cache(maxsize=1 << 16)(_match_rules)
+
+
+# Only the head of a matched line is kept; the report shows 80 chars
+_SNIPPET_LENGTH = 120
+
+# The report lists only the most recent hits of each bucket, so only those are kept;
+# self.patterns still counts every hit
+_REPORT_LIMITS = {'error': 10, 'warning': 10, 'security': 10, 'performance': 5}
+_REPORT_TRACE_LIMIT = 3
+_BUCKET_KEYS = {
+    bucket: frozenset(key for _, _, rule_bucket, _, key in _RULES if rule_bucket == bucket)
+    for bucket in _REPORT_LIMITS
+}
+
+# Files spanning at least two chunks are split at line starts and scanned in parallel
+_PARALLEL_CHUNK_SIZE = 16 << 20
+# A chunk boundary moves past at most this many trace continuation lines; longer
+# runs (indented JSON, payload dumps) are split at the next line start anyway
+_MAX_BOUNDARY_SKIP = 1000
+
+
+def _is_trace_continuation(line):
+    return line.startswith(('at ', '  ')) or 'File' in line
+
+
 class LogAnalyzer:
     def __init__(self):
-        self.errors = []
-        self.warnings = []
-        self.stack_traces = []
-        self.patterns = defaultdict(int)
-        self.security_issues = []
-        self.performance_issues = []
+        # Hits are stored column-wise: <bucket>_types[i] pairs with <bucket>_lines[i]
+        self.error_types = deque(maxlen=_REPORT_LIMITS['error'])
+        self.error_lines = deque(maxlen=_REPORT_LIMITS['error'])
+        self.warning_types = deque(maxlen=_REPORT_LIMITS['warning'])
+        self.warning_lines = deque(maxlen=_REPORT_LIMITS['warning'])
+        self.security_types = deque(maxlen=_REPORT_LIMITS['security'])
+        self.security_lines = deque(maxlen=_REPORT_LIMITS['security'])
+        self.performance_types = deque(maxlen=_REPORT_LIMITS['performance'])
+        self.performance_lines = deque(maxlen=_REPORT_LIMITS['performance'])
+        # The same columns keyed by rule bucket, for the per-hit path
+        self._columns = {
+            'error': (self.error_types, self.error_lines),
+            'warning': (self.warning_types, self.warning_lines),
+            'security': (self.security_types, self.security_lines),
+            'performance': (self.performance_types, self.performance_lines),
+        }
+        self.stack_traces = deque(maxlen=_REPORT_TRACE_LIMIT)
+        self.stack_trace_count = 0
+        self.patterns = Counter()
+        self._trace_buf = []
 
     def analyze_file(self, filepath):
         """Analyze a log file for errors and patterns"""
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+            f = open(filepath, 'rb', buffering=1 << 16)
         except FileNotFoundError:
             print(f"Error: File not found: {filepath}")
             return False
 
-        lines = content.split('\n')
-        for i, line in enumerate(lines):
-            self._process_line(line, i, lines)
+        with f:
+            st = os.fstat(f.fileno())
+            if not stat.S_ISREG(st.st_mode):
+                # Pipes, FIFOs and /proc files can't be sized or seeked; stream them
+                self._analyze_stream(f)
+                return True
+            size = st.st_size
+            workers = min(os.cpu_count() or 1, size // _PARALLEL_CHUNK_SIZE)
+            if workers < 2:
+                # Stream the file so memory stays flat regardless of log size
+                self._analyze_range(f, 0, size)
+                return True
+            bounds = _chunk_bounds(f, size)
+
+        # Large logs: scan chunks in worker processes and merge them in file order
+        with multiprocessing.Pool(workers) as pool:
+            for part in pool.starmap(_scan_range, [(filepath, start, end) for start, end in bounds]):
+                self._merge(part)
 
         return True
 
+    def _analyze_stream(self, f):
+        """Analyze a binary log stream line by line"""
+        for raw in f:
+            self._process_line(raw.decode('utf-8', 'ignore').rstrip('\r\n'))
+        self._close_stack_trace()
+
+    def _analyze_range(self, f, start, end):
+        """Analyze the lines of a binary log file starting between offsets start and end"""
+        f.seek(start)
+        pos = start
+        for raw in f:
+            if pos >= end:
+                break
+            pos += len(raw)
+            self._process_line(raw.decode('utf-8', 'ignore').rstrip('\r\n'))
+        self._close_stack_trace()
+
     def analyze_stdin(self):
         """Analyze log from stdin"""
-        lines = sys.stdin.readlines()
-        for i, line in enumerate(lines):
-            self._process_line(line.strip(), i, lines)
-
-    def _process_line(self, line, index, all_lines):
+        # Read raw bytes and drop invalid UTF-8 like files do, whatever the locale
+        self._analyze_stream(sys.stdin.buffer)
+
+    def _merge(self, other):
+        """Append the results of an analyzer that scanned later lines"""
+        for bucket, (types, lines) in self._columns.items():
+            other_types, other_lines = other._columns[bucket]
+            types.extend(other_types)
+            lines.extend(other_lines)
+        self.stack_traces.extend(other.stack_traces)
+        self.stack_trace_count += other.stack_trace_count
+        self.patterns.update(other.patterns)
+
+    def _hit_count(self, bucket):
+        """Number of hits in a bucket, including those no longer kept"""
+        return sum(self.patterns[key] for key in _BUCKET_KEYS[bucket])
+
+    def _process_line(self, line):
         """Process individual log line"""
-        if not line.strip():
+        self._check_stack_traces(line)
+        stripped = line.strip()
+        if not stripped:
             return
 
         # Check for various error patterns
-        self._check_error_patterns(line)
-        self._check_null_safety_issues(line)
-        self._check_async_errors(line)
-        self._check_security_issues(line)
-        self._check_performance_issues(line)
-        self._check_stack_traces(line, index, all_lines)
-
-    def _check_error_patterns(self, line):
-        """Detect common error patterns"""
-        error_patterns = {
-            r'(NullPointerException|null pointer)': 'Null Pointer Exception',
-            r'(NoSuchMethodError)': 'No Such Method Error',
-            r'(ClassCastException)': 'Type Cast Error',
-            r'(OutOfMemoryError)': 'Out of Memory',
-            r'(StackOverflowError)': 'Stack Overflow',
-            r'(IOException|File not found)': 'File I/O Error',
-            r'(NetworkError|Connection refused)': 'Network Error',
-            r'(TimeoutException)': 'Timeout Error',
-            r'(FormatException|JSON parsing)': 'Format/JSON Parse Error',
-            r'(StateError|Invalid state)': 'State Error',
-        }
+        self._check_patterns(stripped)
+
+    def _check_patterns(self, line):
+        """Detect error, null safety, async, security and performance patterns in a stripped line"""
+        text = _LINE_PREFIX.sub('', line, 1)
+        hits = _match_rules_cached(text) if len(text) <= _MAX_CACHED_LINE else _match_rules(text)
+        if not hits:
+            return
 
-        for pattern, name in error_patterns.items():
-            if re.search(pattern, line, re.IGNORECASE):
-                self.errors.append({
-                    'type': name,
-                    'line': line.strip()
-                })
-                self.patterns[name] += 1
-
-    def _check_null_safety_issues(self, line):
-        """Detect null safety violations"""
-        null_patterns = [
-            r'null safety',
-            r'nullable type',
-            r'null propagation',
-            r'Unhandled Exception.*null',
-            r'accessing.*null',
-        ]
-
-        for pattern in null_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
-                self.warnings.append({
-                    'type': 'Null Safety Issue',
-                    'line': line.strip()
-                })
-                self.patterns['Null Safety Issue'] += 1
-
-    def _check_async_errors(self, line):
-        """Detect async/await and Future-related issues"""
-        async_patterns = [
-            r'(uncaught|unhandled).*(future|async|await)',
-            r'future.*failed',
-            r'(bad state|invalid async)',
-            r'stream.*closed',
-            r'subscript.*cancelled',
-            r'(MissingPluginException)',
-        ]
-
-        for pattern in async_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
-                self.errors.append({
-                    'type': 'Async/Future Error',
-                    'line': line.strip()
-                })
-                self.patterns['Async Error'] += 1
-
-    def _check_security_issues(self, line):
-        """Detect potential security issues"""
-        security_patterns = [
-            (r'(password|secret|token|api.*key).*(stored|saved|hardcoded)', 'Credential Storage'),
-            (r'(ssl|certificate|tls).*verification.*(disabled|false)', 'SSL Verification Disabled'),
-            (r'(sql.*injection|command.*injection)', 'Injection Vulnerability'),
-            (r'(xss|cross.*site.*scripting)', 'XSS Vulnerability'),
-            (r'debug.*(enabled|true).*production', 'Debug Enabled in Production'),
-            (r'log.*password|password.*log', 'Password in Logs'),
-        ]
-
-        for pattern, issue_type in security_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
-                self.security_issues.append({
-                    'type': issue_type,
-                    'line': line.strip()
-                })
-                self.patterns[f'Security: {issue_type}'] += 1
-
-    def _check_performance_issues(self, line):
-        """Detect potential performance issues"""
-        perf_patterns = [
-            (r'ANR.*application not responding', 'ANR (App Not Responding)'),
-            (r'(jank|frame.*drop|dropped.*frame)', 'Dropped Frames'),
-            (r'(memory.*pressure|low.*memory)', 'Memory Pressure'),
-            (r'(OutOfMemory|heap.*size)', 'Memory Issues'),
-            (r'(garbage.*collect|GC)', 'Garbage Collection'),
-            (r'(disk.*full|storage.*full)', 'Disk Full'),
-        ]
-
-        for pattern, issue_type in perf_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
-                self.performance_issues.append({
-                    'type': issue_type,
-                    'line': line.strip()
-                })
-                self.patterns[f'Performance: {issue_type}'] += 1
-
-    def _check_stack_traces(self, line, index, all_lines):
+        snippet = line[:_SNIPPET_LENGTH]
+        columns = self._columns
+        for _, _, bucket, hit_type, _ in hits:
+            types, lines = columns[bucket]
+            types.append(hit_type)
+            lines.append(snippet)
+        # One counter update per line rather than one per hit
+        self.patterns.update([key for *_, key in hits])
+
+    def _check_stack_traces(self, line):
         """Extract and parse stack traces"""
+        # Continuation lines extend the trace being collected
+        if self._trace_buf and _is_trace_continuation(line):
+            self._trace_buf.append(line)
+            return
+
+        self._close_stack_trace()
         if 'at ' in line or 'File' in line and 'Line' in line:
-            # Collect multi-line stack trace
-            trace = [line]
-            i = index + 1
-            while i < len(all_lines) and (all_lines[i].startswith('at ') or
-                                          all_lines[i].startswith('  ') or
-                                          'File' in all_lines[i]):
-                trace.append(all_lines[i])
-                i += 1
-            if len(trace) > 1:
-                self.stack_traces.append('\n'.join(trace))
+            self._trace_buf.append(line)
+
+    def _close_stack_trace(self):
+        """Store the stack trace collected so far"""
+        if len(self._trace_buf) > 1:
+            self.stack_traces.append('\n'.join(self._trace_buf))
+            self.stack_trace_count += 1
+        self._trace_buf.clear()
 
     def print_report(self):
         """Print formatted analysis report"""
-        print("\n" + "="*60)
-        print("FLUTTER LOG ANALYSIS REPORT")
-        print("="*60 + "\n")
+        # Built up front and written once instead of one print() per line
+        out = []
+        out.append("\n" + "="*60)
+        out.append("FLUTTER LOG ANALYSIS REPORT")
+        out.append("="*60 + "\n")
+
+        error_count = self._hit_count('error')
+        warning_count = self._hit_count('warning')
+        security_count = self._hit_count('security')
+        performance_count = self._hit_count('performance')
 
         # Summary
-        print(f"Total Issues Found: {len(self.errors) + len(self.warnings)}")
-        print(f"  - Critical Errors: {len(self.errors)}")
-        print(f"  - Warnings: {len(self.warnings)}")
-        print(f"  - Security Issues: {len(self.security_issues)}")
-        print(f"  - Performance Issues: {len(self.performance_issues)}")
-        print()
+        out.append(f"Total Issues Found: {error_count + warning_count}")
+        out.append(f"  - Critical Errors: {error_count}")
+        out.append(f"  - Warnings: {warning_count}")
+        out.append(f"  - Security Issues: {security_count}")
+        out.append(f"  - Performance Issues: {performance_count}")
+        out.append("")
 
         # Error Patterns
         if self.patterns:
-            print("ERROR PATTERNS DETECTED:")
-            print("-" * 60)
-            for pattern, count in sorted(self.patterns.items(), key=lambda x: x[1], reverse=True):
-                print(f"  • {pattern}: {count} occurrence(s)")
-            print()
+            out.append("ERROR PATTERNS DETECTED:")
+            out.append("-" * 60)
+            for pattern, count in self.patterns.most_common():
+                out.append(f"  • {pattern}: {count} occurrence(s)")
+            out.append("")
 
         # Critical Errors
-        if self.errors:
-            print("CRITICAL ERRORS:")
-            print("-" * 60)
-            for i, error in enumerate(self.errors[:10], 1):  # Show first 10
-                print(f"  {i}. [{error['type']}]")
-                print(f"     {error['line'][:80]}...")
-            if len(self.errors) > 10:
-                print(f"  ... and {len(self.errors) - 10} more")
-            print()
+        if self.error_types:
+            out.append("CRITICAL ERRORS:")
+            out.append("-" * 60)
+            for i, (error_type, line) in enumerate(zip(self.error_types, self.error_lines), 1):  # Most recent 10
+                out.append(f"  {i}. [{error_type}]")
+                out.append(f"     {line[:80]}...")
+            if error_count > len(self.error_types):
+                out.append(f"  ... and {error_count - len(self.error_types)} more")
+            out.append("")
 
         # Security Issues
-        if self.security_issues:
-            print("SECURITY ISSUES:")
-            print("-" * 60)
-            for i, issue in enumerate(self.security_issues[:10], 1):
-                print(f"  {i}. [{issue['type']}]")
-                print(f"     {issue['line'][:80]}...")
-            if len(self.security_issues) > 10:
-                print(f"  ... and {len(self.security_issues) - 10} more")
-            print()
+        if self.security_types:
+            out.append("SECURITY ISSUES:")
+            out.append("-" * 60)
+            for i, (issue_type, line) in enumerate(zip(self.security_types, self.security_lines), 1):
+                out.append(f"  {i}. [{issue_type}]")
+                out.append(f"     {line[:80]}...")
+            if security_count > len(self.security_types):
+                out.append(f"  ... and {security_count - len(self.security_types)} more")
+            out.append("")
 
         # Performance Issues
-        if self.performance_issues:
-            print("PERFORMANCE ISSUES:")
-            print("-" * 60)
-            for i, issue in enumerate(self.performance_issues[:5], 1):
-                print(f"  {i}. [{issue['type']}]")
-                print(f"     {issue['line'][:80]}...")
-            if len(self.performance_issues) > 5:
-                print(f"  ... and {len(self.performance_issues) - 5} more")
-            print()
+        if self.performance_types:
+            out.append("PERFORMANCE ISSUES:")
+            out.append("-" * 60)
+            for i, (issue_type, line) in enumerate(zip(self.performance_types, self.performance_lines), 1):
+                out.append(f"  {i}. [{issue_type}]")
+                out.append(f"     {line[:80]}...")
+            if performance_count > len(self.performance_types):
+                out.append(f"  ... and {performance_count - len(self.performance_types)} more")
+            out.append("")
 
         # Stack Traces
         if self.stack_traces:
-            print("STACK TRACES:")
-            print("-" * 60)
-            for i, trace in enumerate(self.stack_traces[:3], 1):  # Show first 3
-                print(f"\nTrace {i}:")
-                print(trace[:500] + ("..." if len(trace) > 500 else ""))
-            if len(self.stack_traces) > 3:
-                print(f"\n... and {len(self.stack_traces) - 3} more stack traces")
-            print()
-
-        print("="*60)
-        print("RECOMMENDATIONS:")
-        print("-" * 60)
-        if self.errors:
-            print("  1. Address critical errors immediately (NullPointerException, etc.)")
-        if self.async_errors:
-            print("  2. Review async/await code for proper error handling")
-        if self.security_issues:
-            print("  3. Address security issues before release")
-        if self.performance_issues:
-            print("  4. Investigate performance issues (ANRs, memory usage)")
-        print("  5. Run 'flutter doctor -v' to verify environment")
-        print("="*60 + "\n")
+            out.append("STACK TRACES:")
+            out.append("-" * 60)
+            for i, trace in enumerate(self.stack_traces, 1):  # Most recent 3
+                out.append(f"\nTrace {i}:")
+                out.append(trace[:500] + ("..." if len(trace) > 500 else ""))
+            if self.stack_trace_count > len(self.stack_traces):
+                out.append(f"\n... and {self.stack_trace_count - len(self.stack_traces)} more stack traces")
+            out.append("")
+
+        out.append("="*60)
+        out.append("RECOMMENDATIONS:")
+        out.append("-" * 60)
+        if self.error_types:
+            out.append("  1. Address critical errors immediately (NullPointerException, etc.)")
+        if self.patterns['Async Error']:
+            out.append("  2. Review async/await code for proper error handling")
+        if self.security_types:
+            out.append("  3. Address security issues before release")
+        if self.performance_types:
+            out.append("  4. Investigate performance issues (ANRs, memory usage)")
+        out.append("  5. Run 'flutter doctor -v' to verify environment")
+        out.append("="*60 + "\n")
+        sys.stdout.write("\n".join(out) + "\n")
+
+def _chunk_bounds(f, size):
+    """Split a binary log file into (start, end) ranges of roughly _PARALLEL_CHUNK_SIZE.
+
+    Ranges begin at line starts and never on a stack trace continuation line,
+    so every trace is collected whole by a single worker (unless it runs past
+    _MAX_BOUNDARY_SKIP lines).
+    """
+    starts = [0]
+    for offset in range(_PARALLEL_CHUNK_SIZE, size, _PARALLEL_CHUNK_SIZE):
+        if offset <= starts[-1]:
+            continue
+        f.seek(offset - 1)
+        pos = offset - 1 + len(f.readline())
+        for _, raw in zip(range(_MAX_BOUNDARY_SKIP), f):
+            if not _is_trace_continuation(raw.decode('utf-8', 'ignore').rstrip('\r\n')):
+                break
+            pos += len(raw)
+        if pos >= size:
+            break
+        starts.append(pos)
+    return list(zip(starts, starts[1:] + [size]))
+
+
+def _scan_range(filepath, start, end):
+    """Worker entry point: analyze one chunk of a log file"""
+    analyzer = LogAnalyzer()
+    with open(filepath, 'rb', buffering=1 << 16) as f:
+        analyzer._analyze_range(f, start, end)
+    return analyzer
+
 
 def main():
     if len(sys.argv) < 2:
@@ -262,7 +526,7 @@ def main():
     analyzer.print_report()
 
     # Return error code if issues found
-    if analyzer.errors or analyzer.security_issues:
+    if analyzer.error_types or analyzer.security_types:
         sys.exit(1)
 
 if __name__ == '__main__':